@@ -1,13 +1,44 @@
 import asyncio
 
-from create_bot import bot, dp, scheduler
+from aiohttp import web
+from aiogram import Bot
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+
+from create_bot import (bot, dp, WEBHOOK_URL, WEBHOOK_SECRET, WEBHOOK_PATH,
+                        WEBAPP_HOST, WEBAPP_PORT)
 from handlers import routers
 
+try:
+    import uvloop
+    new_event_loop = uvloop.new_event_loop
+except ImportError:
+    new_event_loop = asyncio.new_event_loop
+
+
+async def on_startup(bot: Bot):
+    await bot.set_webhook(WEBHOOK_URL, secret_token=WEBHOOK_SECRET,
+                          drop_pending_updates=True)
+
+
+def run_webhook():
+    # Without a secret anyone reaching the port could post forged updates.
+    if not WEBHOOK_SECRET:
+        raise RuntimeError("WEBHOOK_SECRET must be set to run in webhook mode")
+    dp.startup.register(on_startup)
+    app = web.Application()
+    SimpleRequestHandler(dispatcher=dp, bot=bot,
+                         secret_token=WEBHOOK_SECRET).register(app, path=WEBHOOK_PATH)
+    setup_application(app, dp, bot=bot)
+    web.run_app(app, host=WEBAPP_HOST, port=WEBAPP_PORT, loop=new_event_loop())
+
 
 async def main():
-    dp.include_routers(*routers)
     await bot.delete_webhook(drop_pending_updates=True)
     await dp.start_polling(bot)
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    dp.include_routers(*routers)
+    if WEBHOOK_URL:
+        run_webhook()
+    else:
+        asyncio.run(main(), loop_factory=new_event_loop)
@@ -1,21 +1,77 @@
 import os
+import queue
+import atexit
 import logging
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 
+import orjson
 from aiogram import Bot, Dispatcher
 from aiogram.enums import ParseMode
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.fsm.storage.memory import MemoryStorage
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
+@lru_cache(maxsize=1)
+def get_scheduler():
+    # apscheduler is imported on first use, not on every cold start.
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-scheduler = AsyncIOScheduler(timezone='Europe/Moscow')
+    return AsyncIOScheduler(timezone='Europe/Moscow',
+                            job_defaults={'coalesce': True,
+                                          'max_instances': 1,
+                                          'misfire_grace_time': 60})
 
-logging.basicConfig(level=logging.INFO,
-                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+def __getattr__(name):
+    if name == 'scheduler':
+        return get_scheduler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# The log format uses none of these record attributes, so skip collecting them.
+logging._srcfile = None
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False
+
+# QueueHandler.prepare() still renders the message (%-args, tracebacks) on the
+# calling thread; the asctime/name/level layout and the blocking stream write
+# happen on the listener thread.
+log_queue = queue.SimpleQueue()
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = QueueListener(log_queue, log_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# format is the QueueHandler's pre-render format, not the output format;
+# the output format is set on log_handler above.
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[QueueHandler(log_queue)])
 logger = logging.getLogger(__name__)
 
+WEBHOOK_URL = os.environ.get('WEBHOOK_URL')
+WEBHOOK_SECRET = os.environ.get('WEBHOOK_SECRET')
+WEBHOOK_PATH = os.environ.get('WEBHOOK_PATH', '/webhook')
+WEBAPP_HOST = os.environ.get('WEBAPP_HOST', '0.0.0.0')
+WEBAPP_PORT = int(os.environ.get('WEBAPP_PORT', 8080))
+REDIS_SOCKET = os.environ.get('REDIS_SOCKET')
+
+session = AiohttpSession(json_loads=orjson.loads,
+                         json_dumps=lambda obj: orjson.dumps(obj).decode())
 bot = Bot(token=os.environ.get('BOT_TOKEN'),
+          session=session,
           default=DefaultBotProperties(parse_mode=ParseMode.HTML,
                                        link_preview_is_disabled=True))
-dp = Dispatcher(storage=MemoryStorage())
+if REDIS_SOCKET:
+    from aiogram.fsm.storage.redis import RedisStorage, DefaultKeyBuilder
+    from redis.asyncio import Redis
+
+    storage = RedisStorage(redis=Redis(unix_socket_path=REDIS_SOCKET),
+                           key_builder=DefaultKeyBuilder(with_bot_id=True))
+else:
+    storage = MemoryStorage()
+dp = Dispatcher(storage=storage)
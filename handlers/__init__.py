@@ -1,8 +1,10 @@
+from aiogram import Router
+
 from .base import router as brouter
 
 
-routers = [
+routers: tuple[Router, ...] = (
     brouter,
-]
+)
 
 __all__ = ["routers"]